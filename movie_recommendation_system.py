@@ -1,14 +1,73 @@
+import bisect
 import csv
-import statistics
-from typing import List, Dict, Tuple
+import json
+import os
+import sys
+from array import array
+from typing import List, Dict, NamedTuple, Tuple
+
+# CSV columns the system reads, in the order rows are built
+_FIELDS = ('Title', 'Genre', 'Rating', 'Year', 'Director')
+# Bump when the cache layout changes so stale caches are ignored
+_CACHE_VERSION = 5
+# Numeric columns stored as raw array bytes after the cache's JSON header
+_CACHE_ARRAYS = (('Rating', 'd'), ('Year', 'h'), ('Position', 'i'))
+
+
+class Movie(NamedTuple):
+    """A single movie record loaded from the CSV file."""
+    Title: str
+    Genre: str
+    Rating: float
+    Year: int
+    Director: str
+
+
+def _top_k(ratings, years, genre_codes, genre, min_rating, year_from, year_to, k):
+    """Return indices of the k best-rated rows passing every filter.
+    
+    Expects the columns sorted by rating, best first, so the scan can stop
+    at the k-th match or at the first row below min_rating. genre is a
+    genre code, or -1 to match every row.
+    """
+    top = []
+    for i, (rating, year, g) in enumerate(zip(ratings, years, genre_codes)):
+        # Written as the keep-condition so a NaN min_rating matches nothing
+        if not rating >= min_rating:
+            break
+        if year_from <= year <= year_to and (genre == -1 or g == genre):
+            top.append(i)
+            if len(top) == k:
+                break
+    return top
+
 
 class MovieRecommendationSystem:
     """A simple movie recommendation system using CSV data."""
     
+    __slots__ = ('movies', 'csv_file', '_positions', '_ratings', '_neg_ratings', '_years',
+                 '_genre_codes', '_year_order', '_years_sorted', '_genre_code', '_genres',
+                 '_genre_index')
+    
     def __init__(self, csv_file: str = 'movies.csv'):
         """Initialize the system with movie data from CSV."""
         self.movies = []
         self.csv_file = csv_file
+        # Original CSV row number of each movie, used to break ties in file order
+        self._positions = array('i')
+        # Column views over self.movies, built once by load_movies()
+        self._ratings = array('d')
+        # Negated ratings ascend, so bisect can search the best-first order
+        self._neg_ratings = array('d')
+        self._years = array('h')
+        self._genre_codes = array('H')
+        # Row indices ordered by year, with the matching sorted years
+        self._year_order = array('i')
+        self._years_sorted = array('h')
+        # Genre lookups derived from the columns, also built by load_movies()
+        self._genre_code = {}
+        self._genres = ()
+        self._genre_index = []
         
     def create_sample_csv(self):
         """Create a sample CSV file with movie data if it doesn't exist."""
@@ -51,17 +110,119 @@ class MovieRecommendationSystem:
             print(f"✗ Error creating CSV file: {e}")
             return False
     
+    @property
+    def cache_file(self) -> str:
+        """Path of the parsed-movie cache kept next to the CSV file."""
+        return self.csv_file + '.cache'
+    
+    def _read_cache(self, csv_stat: os.stat_result):
+        """Return (movies, numeric columns) cached for this exact CSV, else None.
+        
+        The cache is one JSON header line (CSV identity and text columns)
+        followed by the numeric columns as packed arrays, so loading it
+        needs no per-value conversion. Any mismatch or damage returns None.
+        """
+        try:
+            with open(self.cache_file, 'rb') as file:
+                header = json.loads(file.readline())
+                if (header['version'] != _CACHE_VERSION
+                        or header['byteorder'] != sys.byteorder
+                        or header['mtime_ns'] != csv_stat.st_mtime_ns
+                        or header['size'] != csv_stat.st_size):
+                    return None
+                count, text = header['count'], header['text']
+                if any(len(column) != count for column in text.values()):
+                    return None
+                numeric = {}
+                for name, typecode in _CACHE_ARRAYS:
+                    numeric[name] = array(typecode)
+                    numeric[name].fromfile(file, count)
+                movies = list(map(Movie, text['Title'], text['Genre'], numeric['Rating'],
+                                  numeric['Year'], text['Director']))
+            return movies, numeric
+        except Exception:
+            return None
+    
+    def _write_cache(self, csv_stat: os.stat_result):
+        """Save the loaded movies so the next load can skip CSV parsing."""
+        numeric = {'Rating': self._ratings, 'Year': self._years, 'Position': self._positions}
+        header = {
+            'version': _CACHE_VERSION,
+            'byteorder': sys.byteorder,
+            'mtime_ns': csv_stat.st_mtime_ns,
+            'size': csv_stat.st_size,
+            'count': len(self.movies),
+            'text': {name: [getattr(m, name) for m in self.movies]
+                     for name in _FIELDS if name not in numeric},
+        }
+        try:
+            with open(self.cache_file, 'wb') as file:
+                file.write(json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n')
+                for name, _ in _CACHE_ARRAYS:
+                    numeric[name].tofile(file)
+        except OSError:
+            pass
+    
+    def _read_csv(self) -> List[Movie]:
+        """Parse the CSV file into movies, in file order."""
+        movies = []
+        with open(self.csv_file, 'r', encoding='utf-8', newline='') as file:
+            # Plain csv.reader rows are indexed by column position, which
+            # avoids DictReader's per-row zip into a header-keyed dict
+            reader = csv.reader(file)
+            header = next(reader, None)
+            if header is None:
+                return movies
+            title, genre, rating, year, director = (header.index(name) for name in _FIELDS)
+            # Convert rating to float and year to int as rows are parsed,
+            # rather than in a second pass over the loaded list
+            for row in reader:
+                if not row:
+                    continue
+                movies.append(Movie(row[title], row[genre], float(row[rating]),
+                                    int(row[year]), row[director]))
+        return movies
+    
     def load_movies(self) -> bool:
         """Load movies from CSV file into memory."""
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                self.movies = [row for row in reader]
+            # Stat before parsing so a CSV edited mid-read never matches the cache
+            csv_stat = os.stat(self.csv_file)
+            cached = self._read_cache(csv_stat)
+            if cached is not None:
+                self.movies, numeric = cached
+                self._ratings, self._years = numeric['Rating'], numeric['Year']
+                self._positions = numeric['Position']
+            else:
+                movies = self._read_csv()
+                
+                # Ratings never change after loading, so sort once (best
+                # first) and let top-N queries take a prefix. The sort is
+                # stable, so equal ratings keep file order
+                positions = sorted(range(len(movies)), key=lambda i: movies[i].Rating,
+                                   reverse=True)
+                self.movies = [movies[i] for i in positions]
+                self._positions = array('i', positions)
                 
-            # Convert rating to float and year to int for proper sorting
-            for movie in self.movies:
-                movie['Rating'] = float(movie['Rating'])
-                movie['Year'] = int(movie['Year'])
+                # Keep the filtered fields as parallel columns so filters
+                # scan a flat sequence instead of looking up keys per row.
+                # Years fit in int16; ratings stay double because float32
+                # would misplace values like 8.7 against a min_rating of 8.7
+                self._ratings = array('d', (m.Rating for m in self.movies))
+                self._years = array('h', (m.Year for m in self.movies))
+                self._write_cache(csv_stat)
+            
+            # Genres are stored as small integer codes, one per lowercase
+            # name, so genre tests compare ints, not strings
+            codes = {}
+            self._genre_codes = array('H', (codes.setdefault(m.Genre.lower(), len(codes))
+                                            for m in self.movies))
+            self._genre_code = codes
+            self._build_genre_index()
+            self._neg_ratings = array('d', (-r for r in self._ratings))
+            self._year_order = array('i', sorted(range(len(self.movies)),
+                                                 key=self._years.__getitem__))
+            self._years_sorted = array('h', (self._years[i] for i in self._year_order))
                 
             print(f"✓ Loaded {len(self.movies)} movies successfully!")
             return True
@@ -74,121 +235,153 @@ class MovieRecommendationSystem:
             print(f"✗ Error loading movies: {e}")
             return False
     
+    def _build_genre_index(self):
+        """Cache the sorted genre names and the row indices of each genre code."""
+        self._genre_index = [array('i') for _ in self._genre_code]
+        for i, code in enumerate(self._genre_codes):
+            self._genre_index[code].append(i)
+        self._genres = tuple(sorted(set(movie.Genre for movie in self.movies)))
+    
     def get_unique_genres(self) -> List[str]:
         """Get list of unique genres from the movie collection."""
-        genres = set(movie['Genre'] for movie in self.movies)
-        return sorted(list(genres))
+        return list(self._genres)
     
-    def filter_by_genre(self, genre: str) -> List[Dict]:
+    def _genre_rows(self, genre: str):
+        """Row indices of a genre (case-insensitive), empty if unknown."""
+        code = self._genre_code.get(genre.lower())
+        return () if code is None else self._genre_index[code]
+    
+    def filter_by_genre(self, genre: str) -> List[Movie]:
         """Filter movies by genre."""
-        return [m for m in self.movies if m['Genre'].lower() == genre.lower()]
+        return [self.movies[i] for i in self._genre_rows(genre)]
+    
+    def count_by_genre(self, genre: str) -> int:
+        """Count movies in a genre without building the filtered list."""
+        return len(self._genre_rows(genre))
     
-    def filter_by_year_range(self, start_year: int, end_year: int) -> List[Dict]:
+    def filter_by_year_range(self, start_year: int, end_year: int) -> List[Movie]:
         """Filter movies by year range."""
-        return [m for m in self.movies if start_year <= m['Year'] <= end_year]
+        lo = bisect.bisect_left(self._years_sorted, start_year)
+        hi = bisect.bisect_right(self._years_sorted, end_year)
+        # Wide ranges are cheaper to scan than to re-sort into row order
+        if hi - lo > len(self.movies) // 4:
+            return [m for m, y in zip(self.movies, self._years) if start_year <= y <= end_year]
+        # Back to row order so results stay best-rated first
+        return [self.movies[i] for i in sorted(self._year_order[lo:hi])]
     
-    def filter_by_min_rating(self, min_rating: float) -> List[Dict]:
+    def filter_by_min_rating(self, min_rating: float) -> List[Movie]:
         """Filter movies with rating >= min_rating."""
-        return [m for m in self.movies if m['Rating'] >= min_rating]
+        # NaN compares false with every rating, as in a plain >= scan
+        if min_rating != min_rating:
+            return []
+        # Ratings are sorted best first, so matches are a prefix
+        end = bisect.bisect_right(self._neg_ratings, -min_rating)
+        return self.movies[:end]
     
-    def get_top_movies(self, n: int = 5, genre: str = None) -> List[Dict]:
+    def get_top_movies(self, n: int = 5, genre: str = None) -> List[Movie]:
         """Get top N movies overall or by genre."""
-        movies_to_sort = self.movies if not genre else self.filter_by_genre(genre)
-        sorted_movies = sorted(movies_to_sort, key=lambda x: x['Rating'], reverse=True)
-        return sorted_movies[:n]
+        if not genre:
+            return self.movies[:n]
+        rows = self._genre_rows(genre)
+        return [self.movies[i] for i in rows[:n]]
     
-    def recommend_movies(self, preferences: Dict) -> List[Dict]:
+    def recommend_movies(self, preferences: Dict) -> List[Movie]:
         """Recommend movies based on user preferences."""
-        filtered_movies = self.movies.copy()
-        
-        # Apply filters based on preferences
-        if 'genre' in preferences and preferences['genre']:
-            filtered_movies = [m for m in filtered_movies 
-                             if m['Genre'].lower() == preferences['genre'].lower()]
-        
-        if 'min_rating' in preferences and preferences['min_rating']:
-            filtered_movies = [m for m in filtered_movies 
-                             if m['Rating'] >= preferences['min_rating']]
+        genre = -1
+        if preferences.get('genre'):
+            genre = self._genre_code.get(preferences['genre'].lower())
+            if genre is None:
+                return []
+        min_rating = preferences.get('min_rating') or float('-inf')
+        year_from = preferences.get('year_from') or float('-inf')
+        year_to = preferences.get('year_to') or float('inf')
         
-        if 'year_from' in preferences and preferences['year_from']:
-            filtered_movies = [m for m in filtered_movies 
-                             if m['Year'] >= preferences['year_from']]
-        
-        if 'year_to' in preferences and preferences['year_to']:
-            filtered_movies = [m for m in filtered_movies 
-                             if m['Year'] <= preferences['year_to']]
-        
-        # Sort by rating and return top 5
-        sorted_movies = sorted(filtered_movies, key=lambda x: x['Rating'], reverse=True)
-        return sorted_movies[:5]
+        # Filter and rank in one pass, then return the top 5
+        top = _top_k(self._ratings, self._years, self._genre_codes,
+                     genre, min_rating, year_from, year_to, 5)
+        return [self.movies[i] for i in top]
     
     def get_statistics(self) -> Dict:
         """Calculate various statistics about the movie collection."""
         stats = {}
         
+        # Single pass over the columns for the rating and year extremes.
+        # Rows are rating-sorted, so year ties fall back to file position
+        # to pick the same movie as min()/max() over the CSV rows
+        best = worst = oldest = newest = 0
+        ratings, years, positions = self._ratings, self._years, self._positions
+        for i, (rating, year) in enumerate(zip(ratings, years)):
+            if rating > ratings[best]:
+                best = i
+            if rating < ratings[worst]:
+                worst = i
+            if year < years[oldest] or (year == years[oldest] and positions[i] < positions[oldest]):
+                oldest = i
+            if year > years[newest] or (year == years[newest] and positions[i] < positions[newest]):
+                newest = i
+        
         # Overall statistics
-        ratings = [m['Rating'] for m in self.movies]
         stats['total_movies'] = len(self.movies)
-        stats['average_rating'] = round(statistics.mean(ratings), 2)
-        stats['highest_rated'] = max(self.movies, key=lambda x: x['Rating'])
-        stats['lowest_rated'] = min(self.movies, key=lambda x: x['Rating'])
+        stats['average_rating'] = round(sum(ratings) / len(ratings), 2)
+        stats['highest_rated'] = self.movies[best]
+        stats['lowest_rated'] = self.movies[worst]
         
-        # Genre statistics
+        # Genre statistics, averaged over each genre's cached row indices
         genre_stats = {}
-        for genre in self.get_unique_genres():
-            genre_movies = self.filter_by_genre(genre)
-            if genre_movies:
-                genre_ratings = [m['Rating'] for m in genre_movies]
-                genre_stats[genre] = {
-                    'count': len(genre_movies),
-                    'avg_rating': round(statistics.mean(genre_ratings), 2)
-                }
+        for genre in self._genres:
+            rows = self._genre_index[self._genre_code[genre.lower()]]
+            genre_stats[genre] = {
+                'count': len(rows),
+                'avg_rating': round(sum(ratings[i] for i in rows) / len(rows), 2)
+            }
         stats['genre_statistics'] = genre_stats
         
         # Year statistics
-        years = [m['Year'] for m in self.movies]
-        stats['oldest_movie'] = min(self.movies, key=lambda x: x['Year'])
-        stats['newest_movie'] = max(self.movies, key=lambda x: x['Year'])
+        stats['oldest_movie'] = self.movies[oldest]
+        stats['newest_movie'] = self.movies[newest]
         
         return stats
     
-    def display_movie(self, movie: Dict):
+    def display_movie(self, movie: Movie):
         """Display a single movie in formatted way."""
-        print(f"  • {movie['Title']} ({movie['Year']})")
-        print(f"    Genre: {movie['Genre']} | Rating: {movie['Rating']}/10 | Director: {movie['Director']}")
+        print(f"  • {movie.Title} ({movie.Year})")
+        print(f"    Genre: {movie.Genre} | Rating: {movie.Rating}/10 | Director: {movie.Director}")
     
-    def display_movies(self, movies: List[Dict], title: str = "Movies"):
+    def display_movies(self, movies: List[Movie], title: str = "Movies"):
         """Display a list of movies in formatted way."""
         if not movies:
             print(f"\n{title}: No movies found matching criteria.")
             return
         
-        print(f"\n{title} ({len(movies)} found):")
-        print("-" * 60)
-        for i, movie in enumerate(movies, 1):
-            print(f"{i}. {movie['Title']} ({movie['Year']})")
-            print(f"   Genre: {movie['Genre']} | Rating: {movie['Rating']}/10")
-            print(f"   Director: {movie['Director']}")
-            if i < len(movies):
-                print()
+        # Build the whole listing and write it in one call
+        entries = "\n\n".join(
+            f"{i}. {movie.Title} ({movie.Year})\n"
+            f"   Genre: {movie.Genre} | Rating: {movie.Rating}/10\n"
+            f"   Director: {movie.Director}"
+            for i, movie in enumerate(movies, 1)
+        )
+        sys.stdout.write(f"\n{title} ({len(movies)} found):\n{'-' * 60}\n{entries}\n")
     
     def display_statistics(self, stats: Dict):
         """Display statistics in formatted way."""
-        print("\n" + "="*60)
-        print("MOVIE DATABASE STATISTICS")
-        print("="*60)
-        
-        print(f"\n📊 Overall Statistics:")
-        print(f"  • Total Movies: {stats['total_movies']}")
-        print(f"  • Average Rating: {stats['average_rating']}/10")
-        print(f"  • Highest Rated: {stats['highest_rated']['Title']} ({stats['highest_rated']['Rating']}/10)")
-        print(f"  • Lowest Rated: {stats['lowest_rated']['Title']} ({stats['lowest_rated']['Rating']}/10)")
-        print(f"  • Oldest Movie: {stats['oldest_movie']['Title']} ({stats['oldest_movie']['Year']})")
-        print(f"  • Newest Movie: {stats['newest_movie']['Title']} ({stats['newest_movie']['Year']})")
-        
-        print(f"\n📈 Genre Analysis:")
-        for genre, info in stats['genre_statistics'].items():
-            print(f"  • {genre}: {info['count']} movies, avg rating: {info['avg_rating']}/10")
+        lines = [
+            "\n" + "="*60,
+            "MOVIE DATABASE STATISTICS",
+            "="*60,
+            "",
+            "📊 Overall Statistics:",
+            f"  • Total Movies: {stats['total_movies']}",
+            f"  • Average Rating: {stats['average_rating']}/10",
+            f"  • Highest Rated: {stats['highest_rated'].Title} ({stats['highest_rated'].Rating}/10)",
+            f"  • Lowest Rated: {stats['lowest_rated'].Title} ({stats['lowest_rated'].Rating}/10)",
+            f"  • Oldest Movie: {stats['oldest_movie'].Title} ({stats['oldest_movie'].Year})",
+            f"  • Newest Movie: {stats['newest_movie'].Title} ({stats['newest_movie'].Year})",
+            "",
+            "📈 Genre Analysis:",
+        ]
+        lines.extend(f"  • {genre}: {info['count']} movies, avg rating: {info['avg_rating']}/10"
+                     for genre, info in stats['genre_statistics'].items())
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
@@ -200,6 +393,10 @@ def main():
         print("Failed to load movies. Exiting...")
         return
     
+    # Genres are fixed once loaded, so build the menu text a single time
+    genres = system.get_unique_genres()
+    genres_text = ", ".join(genres)
+    
     print("\n" + "="*60)
     print("🎬 WELCOME TO MOVIE RECOMMENDATION SYSTEM 🎬")
     print("="*60)
@@ -219,8 +416,7 @@ def main():
         
         if choice == '1':
             # Search by genre
-            genres = system.get_unique_genres()
-            print("\nAvailable genres:", ", ".join(genres))
+            print("\nAvailable genres:", genres_text)
             genre = input("Enter genre: ").strip()
             movies = system.filter_by_genre(genre)
             system.display_movies(movies, f"Movies in {genre} genre")
@@ -252,8 +448,7 @@ def main():
             preferences = {}
             
             # Genre preference
-            genres = system.get_unique_genres()
-            print(f"\nAvailable genres: {', '.join(genres)}")
+            print(f"\nAvailable genres: {genres_text}")
             genre_input = input("Preferred genre: ").strip()
             if genre_input:
                 preferences['genre'] = genre_input
@@ -294,8 +489,7 @@ def main():
                 movies = system.get_top_movies(5)
                 system.display_movies(movies, "🏆 Top 5 Movies Overall")
             elif sub_choice == '2':
-                genres = system.get_unique_genres()
-                print("\nAvailable genres:", ", ".join(genres))
+                print("\nAvailable genres:", genres_text)
                 genre = input("Enter genre: ").strip()
                 movies = system.get_top_movies(5, genre)
                 system.display_movies(movies, f"🏆 Top 5 {genre} Movies")
@@ -309,10 +503,9 @@ def main():
             
         elif choice == '7':
             # View all genres
-            genres = system.get_unique_genres()
             print("\n📚 Available Genres:")
             for i, genre in enumerate(genres, 1):
-                count = len(system.filter_by_genre(genre))
+                count = system.count_by_genre(genre)
                 print(f"  {i}. {genre} ({count} movies)")
                 
         elif choice == '8':